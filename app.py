@@ -1,11 +1,24 @@
 from __future__ import annotations
 
+import os
+import shutil
 import sys
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
-
-from PyQt6.QtCore import Qt, QSize, QTimer, QSettings
-from PyQt6.QtGui import QIcon, QPixmap, QAction, QKeySequence, QColor, QBrush
+from typing import Dict, List, Optional, Tuple, Union
+
+from PyQt6.QtCore import Qt, QSize, QTimer, QSettings, QThreadPool
+from PyQt6.QtGui import (
+    QIcon,
+    QPixmap,
+    QAction,
+    QKeySequence,
+    QColor,
+    QBrush,
+    QImage,
+    QPainter,
+)
 from PyQt6.QtWidgets import (
     QFileDialog,
     QHeaderView,
@@ -15,12 +28,13 @@ from PyQt6.QtWidgets import (
     QToolBar,
     QTreeWidgetItem,
 )
-from PyQt6.QtSvgWidgets import QSvgWidget
-from PIL import Image, ImageSequence
+from PyQt6.QtSvg import QSvgRenderer
+from PIL import GifImagePlugin, Image, ImageQt
 
 from .dialogs import SettingsDialog, AboutDialog
 from .model import FrameData, AppConfig, load_config, save_config
 from .ui_main import build_main_ui
+from .workers import GifSaveWorker
 from . import __version__
 
 
@@ -31,6 +45,27 @@ SETTINGS_NAME = "GeeksAnimatedGIFEditor"
 IMAGE_FILTERS = "Images (*.png *.jpg *.jpeg *.bmp *.gif *.svg);;All Files (*)"
 GIF_FILTER = "GIF Images (*.gif);;All Files (*)"
 
+# Keep GIF frames in palette mode unless their palette differs from the first
+# frame's; frames are converted to RGBA only when displayed or saved.
+GifImagePlugin.LOADING_STRATEGY = (
+    GifImagePlugin.LoadingStrategy.RGB_AFTER_DIFFERENT_PALETTE_ONLY
+)
+
+# Cache key for a frame's pixels: (source_path, mtime) for files on disk, or
+# (frame_id, 0.0) for frames held in memory.
+FrameKey = Tuple[Union[str, int], float]
+
+# Pillow's reducing_gap for frame resizes on save; 3.0 is visually
+# indistinguishable from a plain LANCZOS resize on large downscales
+RESIZE_REDUCING_GAP = 3.0
+
+# Max number of scaled pixmaps kept around for the preview pane
+PREVIEW_CACHE_SIZE = 64
+
+# Memory budget for full-resolution preview decodes; a single camera JPEG can
+# be ~100 MB as a pixmap, so this cache is bounded by bytes, not entries
+FULL_PIX_CACHE_BYTES = 256 * 1024 * 1024
+
 ALIGN_OPTIONS = [
     ("Top Left", (0.0, 0.0)),
     ("Top Center", (0.5, 0.0)),
@@ -44,6 +79,22 @@ ALIGN_OPTIONS = [
 ]
 
 
+def _export_image_file(src: Path, dst: Path) -> None:
+    """Re-save an image file as dst; runs on export worker threads."""
+    with Image.open(str(src)) as img:
+        img.save(str(dst))
+
+
+def _export_pil_image(img: Image.Image, dst: Path) -> None:
+    """Save an in-memory frame as RGBA; runs on export worker threads.
+
+    Works on a private copy, since duplicated frames share one image object
+    and Image.save mutates the image it is called on.
+    """
+    rgba = img.copy() if img.mode == "RGBA" else img.convert("RGBA")
+    rgba.save(str(dst))
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -55,6 +106,10 @@ class MainWindow(QMainWindow):
         self.base_dir = Path(__file__).resolve().parent
         self.assets_dir = self.base_dir / "assets"
 
+        # Earlier versions extracted opened GIF frames into _tmp_frames and never
+        # removed them; frames now live in memory, so clear out any leftovers.
+        shutil.rmtree(self.base_dir / "_tmp_frames", ignore_errors=True)
+
         # State
         self.frames: List[FrameData] = []
         self.current_index: int = -1
@@ -63,9 +118,19 @@ class MainWindow(QMainWindow):
         self.is_playing: bool = False
         self.play_timer = QTimer(self)
         self.play_timer.timeout.connect(self.advance_frame_for_playback)
+        # Coalesces the burst of resize events during a window drag into a
+        # single preview redraw
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(30)
+        self._resize_timer.timeout.connect(self.update_preview)
         self.wave_direction = 1
 
         self.unsaved_changes: bool = False
+        self.save_in_progress: bool = False
+        # Set by mark_unsaved so a background save knows about edits made
+        # while it was running
+        self._edited_during_save: bool = False
         self.current_gif_path: Optional[Path] = None
         self.align_anchor = (0.5, 0.5)  # centered by default
         self.output_size: Optional[Tuple[int, int]] = None
@@ -79,6 +144,25 @@ class MainWindow(QMainWindow):
         self.checkbox_unchecked_icon = QIcon(str(unchecked_path)) if unchecked_path.exists() else QIcon()
         self.checkbox_checked_icon = QIcon(str(checked_path)) if checked_path.exists() else QIcon()
 
+        # Row brushes, shared by every tree item
+        self._brush_custom_dur = QBrush(QColor(230, 230, 230))
+        self._brush_default_dur = QBrush(QColor(150, 150, 150))
+        self._brush_checked_row = QBrush(QColor(60, 90, 160, 60))
+        self._brush_unchecked_row = QBrush()
+
+        # Thumbnail caches, one entry per source holding (mtime, thumb_size,
+        # icon) so an edited source file or a new thumbnail size re-renders.
+        self._thumb_cache: Dict[Union[str, int], Tuple[float, int, QIcon]] = {}
+        self._svg_renderers: Dict[str, Tuple[float, QSvgRenderer]] = {}
+
+        # Preview caches (LRU): full-resolution decodes per source file, and
+        # the scaled result per (source_path, mtime, label width, height).
+        self._full_pix_cache: OrderedDict[FrameKey, QPixmap] = OrderedDict()
+        self._full_pix_bytes: int = 0
+        self._preview_cache: OrderedDict[
+            Tuple[Union[str, int], float, int, int], QPixmap
+        ] = OrderedDict()
+
         # Actions, menus, toolbars, central UI
         self.create_actions()
         self.create_menu_toolbar()
@@ -94,6 +178,7 @@ class MainWindow(QMainWindow):
         if not self.maybe_save_before_discard():
             event.ignore()
             return
+        self.wait_for_save()
         if self.config.remember_geometry:
             self.save_window_geometry()
         save_config(self.base_dir, self.config)
@@ -119,21 +204,15 @@ class MainWindow(QMainWindow):
             self.resize(1000, 650)
 
     def load_app_icon(self) -> None:
-        """Set window/application icon from GeeksGIFEditorLogo.png (multi-size)."""
+        """Set window/application icon from GeeksGIFEditorLogo.png.
+
+        Qt's icon engine scales the file lazily to whatever sizes the platform
+        asks for, so no per-size variants are pre-rendered here.
+        """
         icon_path = self.assets_dir / "GeeksGIFEditorLogo.png"
         if icon_path.exists():
-            pix = QPixmap(str(icon_path))
             icon = QIcon()
-            for size in (16, 24, 32, 48, 64, 128, 256):
-                if not pix.isNull():
-                    icon.addPixmap(
-                        pix.scaled(
-                            size,
-                            size,
-                            Qt.AspectRatioMode.KeepAspectRatio,
-                            Qt.TransformationMode.SmoothTransformation,
-                        )
-                    )
+            icon.addFile(str(icon_path))
             self.setWindowIcon(icon)
             from PyQt6.QtWidgets import QApplication
 
@@ -225,6 +304,9 @@ class MainWindow(QMainWindow):
         self.mode_combo.currentIndexChanged.connect(self.on_mode_changed)
 
     def apply_config_to_ui(self) -> None:
+        thumb_size_changed = self.tree.iconSize().width() != self.config.thumb_size
+        if thumb_size_changed:
+            self._thumb_cache.clear()
         self.tree.setIconSize(QSize(self.config.thumb_size, self.config.thumb_size))
         row_h = max(32, self.config.thumb_size + 8)
         self.tree.setStyleSheet(f"QTreeWidget::item {{ height: {row_h}px; }}")
@@ -243,19 +325,20 @@ class MainWindow(QMainWindow):
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
 
+        if thumb_size_changed and self.frames:
+            self.populate_tree()
+
     # ---------- Tree / frames ----------
-    def rebuild_tree(self) -> None:
+    def populate_tree(self) -> None:
+        """Recreate every row; used when frames are added, removed or replaced."""
+        # Build the rows detached and insert them in one call so the view does
+        # a single layout/repaint pass instead of one per row.
+        self.tree.setUpdatesEnabled(False)
+        self.tree.blockSignals(True)
         self.tree.clear()
-        for idx, frame in enumerate(self.frames):
-            item = QTreeWidgetItem(self.tree)
-            item.setData(0, Qt.ItemDataRole.UserRole, idx)
-
-            icon = (
-                self.checkbox_checked_icon
-                if frame.is_checked
-                else self.checkbox_unchecked_icon
-            )
-            item.setIcon(0, icon)
+        items = []
+        for frame in self.frames:
+            item = QTreeWidgetItem()
             item.setText(0, "")
 
             thumb_icon = self.make_thumbnail_icon(frame)
@@ -264,67 +347,204 @@ class MainWindow(QMainWindow):
             item.setText(1, "")
 
             item.setText(2, frame.display_name)
-
-            if frame.is_custom_duration:
-                item.setText(3, str(frame.duration_ms))
-                item.setForeground(3, QBrush(QColor(230, 230, 230)))
-            else:
-                item.setText(3, str(self.default_duration_ms))
-                item.setForeground(3, QBrush(QColor(150, 150, 150)))
-
             item.setTextAlignment(
                 3, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
             )
 
-            if frame.is_checked:
-                brush = QBrush(QColor(60, 90, 160, 60))
-                for c in range(4):
-                    item.setBackground(c, brush)
+            self._apply_item_checked(item, frame)
+            self._apply_item_duration(item, frame)
+            items.append(item)
 
-        if 0 <= self.current_index < len(self.frames):
-            for i in range(self.tree.topLevelItemCount()):
-                it = self.tree.topLevelItem(i)
-                if it.data(0, Qt.ItemDataRole.UserRole) == self.current_index:
-                    self.tree.setCurrentItem(it)
-                    break
+        self.tree.addTopLevelItems(items)
+        self.tree.blockSignals(False)
+        self.tree.setUpdatesEnabled(True)
+        self.tree.viewport().update()
 
-        self.update_title_and_status()
+        self.select_current_item()
         self.update_preview()
 
-    def make_thumbnail_icon(self, frame: FrameData) -> Optional[QIcon]:
+    def select_current_item(self) -> None:
+        # Rows are kept in the same order as self.frames
+        if 0 <= self.current_index < self.tree.topLevelItemCount():
+            self.tree.setCurrentItem(self.tree.topLevelItem(self.current_index))
+
+    def update_item_checked(self, idx: int) -> None:
+        """Refresh the checkbox icon and row highlight of a single row."""
+        item = self.tree.topLevelItem(idx)
+        if item is None or idx >= len(self.frames):
+            return
+        self._apply_item_checked(item, self.frames[idx])
+
+    def _apply_item_checked(self, item: QTreeWidgetItem, frame: FrameData) -> None:
+        icon = (
+            self.checkbox_checked_icon
+            if frame.is_checked
+            else self.checkbox_unchecked_icon
+        )
+        item.setIcon(0, icon)
+
+        brush = (
+            self._brush_checked_row
+            if frame.is_checked
+            else self._brush_unchecked_row
+        )
+        for c in range(4):
+            item.setBackground(c, brush)
+
+    def update_item_duration(self, idx: int) -> None:
+        """Refresh the duration column of a single row."""
+        item = self.tree.topLevelItem(idx)
+        if item is None or idx >= len(self.frames):
+            return
+        self._apply_item_duration(item, self.frames[idx])
+
+    def _apply_item_duration(self, item: QTreeWidgetItem, frame: FrameData) -> None:
+        if frame.is_custom_duration:
+            item.setText(3, str(frame.duration_ms))
+            item.setForeground(3, self._brush_custom_dur)
+        else:
+            item.setText(3, str(self.default_duration_ms))
+            item.setForeground(3, self._brush_default_dur)
+
+    def swap_items(self, i: int, j: int) -> None:
+        """Swap two rows in place to mirror a swap in self.frames."""
+        if i == j:
+            return
+        i, j = min(i, j), max(i, j)
+        item_j = self.tree.takeTopLevelItem(j)
+        item_i = self.tree.takeTopLevelItem(i)
+        if item_i is None or item_j is None:
+            self.populate_tree()
+            return
+        self.tree.insertTopLevelItem(i, item_j)
+        self.tree.insertTopLevelItem(j, item_i)
+
+    def frame_cache_key(self, frame: FrameData) -> Optional[FrameKey]:
+        """Identify a frame's pixels for cache lookups.
+
+        Returns None if the frame has nothing to display.
+        """
+        if frame.pil_image is not None:
+            return frame.frame_id, 0.0
         if not frame.source_path:
             return None
-        p = Path(frame.source_path)
-        if not p.exists():
+        try:
+            return frame.source_path, frame.path.stat().st_mtime
+        except OSError:
+            return None
+
+    def frame_rgba(self, frame: FrameData) -> Image.Image:
+        """Return an in-memory frame as RGBA, converting palette frames lazily.
+
+        RGBA frames are returned as the stored image itself, not a copy, so
+        callers must not modify the result in place.
+        """
+        img = frame.pil_image
+        return img if img.mode == "RGBA" else img.convert("RGBA")
+
+    def forget_frame_caches(self, frame: FrameData) -> None:
+        """Drop cached pixmaps of an in-memory frame that left the project.
+
+        File-backed entries are left alone; they are revalidated by mtime and
+        may still be shared with other frames using the same file. Entries are
+        also kept while a duplicate with the same frame_id remains.
+        """
+        if frame.pil_image is None:
+            return
+        if any(f.frame_id == frame.frame_id for f in self.frames):
+            return
+        self._thumb_cache.pop(frame.frame_id, None)
+        self._drop_full_pixmap((frame.frame_id, 0.0))
+        for key in [k for k in self._preview_cache if k[0] == frame.frame_id]:
+            del self._preview_cache[key]
+
+    def clear_frame_caches(self) -> None:
+        self._thumb_cache.clear()
+        self._svg_renderers.clear()
+        self._full_pix_cache.clear()
+        self._full_pix_bytes = 0
+        self._preview_cache.clear()
+
+    def make_thumbnail_icon(self, frame: FrameData) -> Optional[QIcon]:
+        frame_key = self.frame_cache_key(frame)
+        if frame_key is None:
             return None
+        source, mtime = frame_key
+        size = self.config.thumb_size
+        cached = self._thumb_cache.get(source)
+        if cached is not None and cached[0] == mtime and cached[1] == size:
+            return cached[2]
+
         try:
-            if p.suffix.lower() == ".svg":
-                widget = QSvgWidget(str(p))
-                widget.resize(self.config.thumb_size, self.config.thumb_size)
-                pix = QPixmap(widget.size())
-                pix.fill(Qt.GlobalColor.transparent)
-                widget.render(pix)
+            if frame.pil_image is not None:
+                pix = self._thumbnail_pixmap(self.frame_rgba(frame).copy(), size)
             else:
-                pix = QPixmap(str(p))
+                if frame.is_svg:
+                    pix = QPixmap.fromImage(
+                        self.render_svg(frame.path, mtime, size, size)
+                    )
+                else:
+                    pix = self._load_scaled_pixmap(frame.path, size)
 
             if pix.isNull():
                 return None
 
             pix = pix.scaled(
-                self.config.thumb_size,
-                self.config.thumb_size,
+                size,
+                size,
                 Qt.AspectRatioMode.KeepAspectRatio,
                 Qt.TransformationMode.SmoothTransformation,
             )
-            return QIcon(pix)
+            icon = QIcon(pix)
         except Exception:
             return None
 
+        self._thumb_cache[source] = (mtime, size, icon)
+        return icon
+
+    def _load_scaled_pixmap(self, path: Path, size: int) -> QPixmap:
+        """Decode path at roughly size x size, avoiding a full-resolution load.
+
+        JPEGs are decoded with libjpeg's scaled IDCT via draft(); other formats
+        are downsampled by Pillow before crossing into Qt.
+        """
+        try:
+            with Image.open(str(path)) as img:
+                img.draft("RGB", (size * 2, size * 2))
+                return self._thumbnail_pixmap(img, size)
+        except Exception:
+            # Formats Pillow can't handle may still load through Qt
+            return QPixmap(str(path))
+
+    def _thumbnail_pixmap(self, img: Image.Image, size: int) -> QPixmap:
+        """Shrink img in place to fit size x size and convert it for Qt."""
+        img.thumbnail((size, size), Image.Resampling.LANCZOS)
+        return QPixmap.fromImage(ImageQt.ImageQt(img.convert("RGBA")))
+
+    def _get_svg_renderer(self, path: Path, mtime: float) -> QSvgRenderer:
+        """Return a parsed QSvgRenderer for path, reusing it until mtime changes."""
+        key = str(path)
+        cached = self._svg_renderers.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        renderer = QSvgRenderer(key)
+        self._svg_renderers[key] = (mtime, renderer)
+        return renderer
+
+    def render_svg(self, path: Path, mtime: float, width: int, height: int) -> QImage:
+        """Render an SVG file into a transparent RGBA8888 image."""
+        renderer = self._get_svg_renderer(path, mtime)
+        img = QImage(width, height, QImage.Format.Format_RGBA8888)
+        img.fill(0)
+        painter = QPainter(img)
+        renderer.render(painter)
+        painter.end()
+        return img
+
     def on_tree_item_clicked(self, item: QTreeWidgetItem, column: int) -> None:
-        idx = item.data(0, Qt.ItemDataRole.UserRole)
-        if idx is None:
+        idx = self.tree.indexOfTopLevelItem(item)
+        if idx < 0 or idx >= len(self.frames):
             return
-        idx = int(idx)
 
         if column == 3:
             self.edit_duration_for_frame(idx)
@@ -332,14 +552,14 @@ class MainWindow(QMainWindow):
             frame = self.frames[idx]
             frame.is_checked = not frame.is_checked
             self.current_index = idx
+            self.update_item_checked(idx)
             self.mark_unsaved()
-            self.rebuild_tree()
+            self.update_preview()
 
     def on_tree_item_double_clicked(self, item: QTreeWidgetItem, column: int) -> None:
-        idx = item.data(0, Qt.ItemDataRole.UserRole)
-        if idx is None:
+        idx = self.tree.indexOfTopLevelItem(item)
+        if idx < 0:
             return
-        idx = int(idx)
         if column == 3:
             self.edit_duration_for_frame(idx)
 
@@ -362,23 +582,25 @@ class MainWindow(QMainWindow):
             frame.duration_ms = val
             frame.is_custom_duration = val != self.default_duration_ms
             self.current_index = idx
+            self.update_item_duration(idx)
+            self.select_current_item()
             self.mark_unsaved()
-            self.rebuild_tree()
+            self.update_preview()
 
     def on_default_duration_changed(self, value: int) -> None:
         self.default_duration_ms = value
-        for f in self.frames:
+        for idx, f in enumerate(self.frames):
             if not f.is_custom_duration:
                 f.duration_ms = value
+                self.update_item_duration(idx)
         self.mark_unsaved()
-        self.rebuild_tree()
 
     def on_overwrite_all_clicked(self) -> None:
-        for f in self.frames:
+        for idx, f in enumerate(self.frames):
             f.duration_ms = self.default_duration_ms
             f.is_custom_duration = False
+            self.update_item_duration(idx)
         self.mark_unsaved()
-        self.rebuild_tree()
 
     def on_mode_changed(self, index: int) -> None:
         self.animation_mode = self.mode_combo.currentData()
@@ -414,7 +636,7 @@ class MainWindow(QMainWindow):
             self.current_index = 0
 
         self.mark_unsaved()
-        self.rebuild_tree()
+        self.populate_tree()
         if self.frames and not self.is_playing:
             self.start_playback()
 
@@ -422,20 +644,20 @@ class MainWindow(QMainWindow):
         item = self.tree.currentItem()
         if not item:
             return -1
-        idx = item.data(0, Qt.ItemDataRole.UserRole)
-        return int(idx) if idx is not None else -1
+        return self.tree.indexOfTopLevelItem(item)
 
     def remove_selected(self) -> None:
         idx = self.get_selected_index()
         if idx < 0 or idx >= len(self.frames):
             return
-        del self.frames[idx]
+        removed = self.frames.pop(idx)
+        self.forget_frame_caches(removed)
         if not self.frames:
             self.current_index = -1
         else:
             self.current_index = max(0, min(idx, len(self.frames) - 1))
         self.mark_unsaved()
-        self.rebuild_tree()
+        self.populate_tree()
 
     def duplicate_selected(self) -> None:
         idx = self.get_selected_index()
@@ -448,11 +670,14 @@ class MainWindow(QMainWindow):
             duration_ms=f.duration_ms,
             is_custom_duration=f.is_custom_duration,
             is_checked=f.is_checked,
+            pil_image=f.pil_image,
+            # Same pixels, so share cache entries (and the decode on save)
+            frame_id=f.frame_id,
         )
         self.frames.insert(idx + 1, dup)
         self.current_index = idx + 1
         self.mark_unsaved()
-        self.rebuild_tree()
+        self.populate_tree()
 
     def move_up(self) -> None:
         idx = self.get_selected_index()
@@ -462,9 +687,11 @@ class MainWindow(QMainWindow):
             self.frames[idx],
             self.frames[idx - 1],
         )
+        self.swap_items(idx - 1, idx)
         self.current_index = idx - 1
+        self.select_current_item()
         self.mark_unsaved()
-        self.rebuild_tree()
+        self.update_preview()
 
     def move_down(self) -> None:
         idx = self.get_selected_index()
@@ -474,9 +701,11 @@ class MainWindow(QMainWindow):
             self.frames[idx],
             self.frames[idx + 1],
         )
+        self.swap_items(idx, idx + 1)
         self.current_index = idx + 1
+        self.select_current_item()
         self.mark_unsaved()
-        self.rebuild_tree()
+        self.update_preview()
 
     def export_checked(self) -> None:
         checked = [f for f in self.frames if f.is_checked]
@@ -500,28 +729,14 @@ class MainWindow(QMainWindow):
             self.config.last_export_dir = out_dir_str
         out_dir = Path(out_dir_str)
 
-        for f in checked:
-            src = Path(f.source_path) if f.source_path else None
-            if not src or not src.exists():
-                continue
-            if src.suffix.lower() == ".svg":
-                widget = QSvgWidget(str(src))
-                widget.resize(self.config.thumb_size, self.config.thumb_size)
-                pix = QPixmap(widget.size())
-                pix.fill(Qt.GlobalColor.transparent)
-                widget.render(pix)
-                export_path = out_dir / (
-                    f.display_name
-                    if f.display_name.lower().endswith(".png")
-                    else f.display_name + ".png"
-                )
-                pix.save(str(export_path), "PNG")
-            else:
-                img = Image.open(str(src))
-                export_path = out_dir / f.display_name
-                if not export_path.suffix:
-                    export_path = export_path.with_suffix(".png")
-                img.save(str(export_path))
+        # Pillow encodes/decodes release the GIL, so raster frames are written
+        # from a thread pool. SVGs render through Qt and stay on this thread.
+        jobs: List[Future] = []
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            for f in checked:
+                self._export_frame(f, out_dir, pool, jobs)
+        for job in jobs:
+            job.result()
 
         QMessageBox.information(
             self,
@@ -529,15 +744,48 @@ class MainWindow(QMainWindow):
             f"Exported {len(checked)} frame(s) to {out_dir}",
         )
 
+    def _export_frame(
+        self,
+        f: FrameData,
+        out_dir: Path,
+        pool: ThreadPoolExecutor,
+        jobs: List[Future],
+    ) -> None:
+        if f.pil_image is not None:
+            export_path = out_dir / f.display_name
+            if not export_path.suffix:
+                export_path = export_path.with_suffix(".png")
+            jobs.append(pool.submit(_export_pil_image, f.pil_image, export_path))
+            return
+        src = f.path
+        if not src or not src.exists():
+            return
+        if f.is_svg:
+            size = self.config.thumb_size
+            qimg = self.render_svg(src, src.stat().st_mtime, size, size)
+            export_path = out_dir / (
+                f.display_name
+                if f.display_name.lower().endswith(".png")
+                else f.display_name + ".png"
+            )
+            qimg.save(str(export_path), "PNG")
+        else:
+            export_path = out_dir / f.display_name
+            if not export_path.suffix:
+                export_path = export_path.with_suffix(".png")
+            jobs.append(pool.submit(_export_image_file, src, export_path))
+
     # ---------- New/Open/Save ----------
     def new_project(self) -> None:
         if not self.maybe_save_before_discard():
             return
         self.frames.clear()
+        self.clear_frame_caches()
         self.current_index = -1
         self.current_gif_path = None
         self.unsaved_changes = False
-        self.rebuild_tree()
+        self.update_title_and_status()
+        self.populate_tree()
 
     def open_gif(self) -> None:
         start_dir = (
@@ -566,34 +814,31 @@ class MainWindow(QMainWindow):
             return
 
         self.frames.clear()
+        self.clear_frame_caches()
         base_name = p.stem
         durations: List[int] = []
-        tmp_dir = self.base_dir / "_tmp_frames"
-        tmp_dir.mkdir(exist_ok=True)
 
-        idx = 1
+        # Frames are kept decoded in memory; they only hit disk on export/save
         try:
-            for frame in ImageSequence.Iterator(im):
-                dur = frame.info.get("duration", self.default_duration_ms)
+            for idx in range(getattr(im, "n_frames", 1)):
+                im.seek(idx)
+                dur = im.info.get("duration", self.default_duration_ms)
                 durations.append(dur)
-                disp_name = f"{base_name}_{idx:03d}.png"
-                tmp_path = tmp_dir / disp_name
-                frame_rgba = frame.convert("RGBA")
-                frame_rgba.save(str(tmp_path))
+                disp_name = f"{base_name}_{idx + 1:03d}.png"
                 self.frames.append(
                     FrameData(
-                        source_path=str(tmp_path),
+                        source_path=None,
                         display_name=disp_name,
                         duration_ms=dur,
                         is_custom_duration=False,
                         is_checked=False,
+                        pil_image=im.copy(),
                     )
                 )
-                idx += 1
         finally:
             im.close()
 
-        if durations and all(d == durations[0] for d in durations):
+        if len(set(durations)) == 1:
             self.default_duration_ms = durations[0]
             for f in self.frames:
                 f.duration_ms = self.default_duration_ms
@@ -606,7 +851,8 @@ class MainWindow(QMainWindow):
         self.current_index = 0 if self.frames else -1
         self.current_gif_path = p
         self.unsaved_changes = False
-        self.rebuild_tree()
+        self.update_title_and_status()
+        self.populate_tree()
         if self.frames:
             self.start_playback()
 
@@ -636,15 +882,15 @@ class MainWindow(QMainWindow):
         self.current_gif_path = p
 
     def _save_gif_to_path(self, path: Path) -> None:
+        # Only one background encode at a time
+        if self.save_in_progress:
+            return
         if not self.frames:
             QMessageBox.information(
                 self, "Save GIF", "No frames to save."
             )
             return
 
-        images = []
-        durations: List[int] = []
-
         first_img, w, h = self.load_frame_image(self.frames[0], None)
         if first_img is None:
             QMessageBox.critical(
@@ -653,12 +899,32 @@ class MainWindow(QMainWindow):
             return
         out_size = (w, h)
 
-        for f in self.frames:
-            img, _, _ = self.load_frame_image(f, out_size)
-            if img is None:
-                continue
-            images.append(img)
-            durations.append(f.duration_ms)
+        # The first frame already defines the output size; don't decode it twice.
+        # Frames sharing a source file or frame_id (e.g. duplicates) are
+        # decoded once per save.
+        images = [first_img]
+        durations: List[int] = [self.frames[0].duration_ms]
+
+        # Raster and in-memory frames are decoded/resized in parallel up front;
+        # SVG frames render through Qt widgets and must stay on this thread.
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            decoded: Dict[FrameKey, Future] = {}
+            for f in self.frames[1:]:
+                key = self.frame_cache_key(f)
+                if key is None or key in decoded or f.is_svg:
+                    continue
+                decoded[key] = pool.submit(self.load_frame_image, f, out_size)
+
+            for f in self.frames[1:]:
+                key = self.frame_cache_key(f)
+                if key in decoded:
+                    img, _, _ = decoded[key].result()
+                else:
+                    img, _, _ = self.load_frame_image(f, out_size)
+                if img is None:
+                    continue
+                images.append(img)
+                durations.append(f.duration_ms)
 
         if not images:
             QMessageBox.critical(
@@ -668,64 +934,111 @@ class MainWindow(QMainWindow):
             )
             return
 
-        try:
-            images[0].save(
-                str(path),
-                save_all=True,
-                append_images=images[1:],
-                duration=durations,
-                loop=0,
-                disposal=2,
-            )
-        except Exception as e:
-            QMessageBox.critical(
-                self, "Save GIF", f"Error saving GIF:\n{e}"
-            )
-            return
-
-        self.unsaved_changes = False
+        # The GIF encode runs on the global thread pool; results come back
+        # through queued signals on this thread. Image.save stores encoder
+        # options on the image it is called on, so the worker gets its own
+        # copy of the first frame rather than a live FrameData.pil_image.
+        images[0] = images[0].copy()
+        worker = GifSaveWorker(path, images, durations)
+        worker.signals.progress.connect(self.save_progress.setValue)
+        worker.signals.finished.connect(self.on_save_finished)
+        worker.signals.failed.connect(self.on_save_failed)
+
+        self.save_in_progress = True
+        self._edited_during_save = False
+        self.act_save.setEnabled(False)
+        self.act_save_as.setEnabled(False)
+        self.save_progress.setRange(0, len(images))
+        self.save_progress.setValue(0)
+        self.save_progress.show()
+        QThreadPool.globalInstance().start(worker)
+
+    def _end_save(self) -> None:
+        self.save_in_progress = False
+        self.act_save.setEnabled(True)
+        self.act_save_as.setEnabled(True)
+        self.save_progress.hide()
+
+    def on_save_finished(self, path: str) -> None:
+        self._end_save()
+        if not self._edited_during_save:
+            self.unsaved_changes = False
         self.update_title_and_status()
         QMessageBox.information(
             self, "Save GIF", f"Saved animated GIF to:\n{path}"
         )
 
+    def on_save_failed(self, message: str) -> None:
+        self._end_save()
+        QMessageBox.critical(
+            self, "Save GIF", f"Error saving GIF:\n{message}"
+        )
+
+    def wait_for_save(self) -> None:
+        """Block until a background save finishes and its result is handled."""
+        if not self.save_in_progress:
+            return
+        QThreadPool.globalInstance().waitForDone()
+        from PyQt6.QtWidgets import QApplication
+
+        # Deliver the worker's queued finished/failed signal
+        QApplication.processEvents()
+
     def load_frame_image(
         self, frame: FrameData, expected_size: Optional[Tuple[int, int]]
     ):
-        if not frame.source_path:
+        if frame.pil_image is None and not frame.source_path:
             return None, 0, 0
-        p = Path(frame.source_path)
-        if not p.exists():
+        p = frame.path if frame.pil_image is None else None
+        if p is not None and not p.exists():
             return None, 0, 0
+
         try:
-            if p.suffix.lower() == ".svg":
-                widget = QSvgWidget(str(p))
-                widget.resize(*(expected_size or (512, 512)))
-                pix = QPixmap(widget.size())
-                pix.fill(Qt.GlobalColor.transparent)
-                widget.render(pix)
-                img_bytes = (
-                    pix.toImage()
-                    .bits()
-                    .asstring(pix.width() * pix.height() * 4)
+            if p is None:
+                img = self.frame_rgba(frame)
+            elif frame.is_svg:
+                # Render straight into an RGBA8888 image so its buffer can be
+                # handed to Pillow as-is (one copy, no channel swizzling)
+                qimg = self.render_svg(
+                    p, p.stat().st_mtime, *(expected_size or (512, 512))
                 )
-                from PIL import Image as PILImage
-
-                img = PILImage.frombytes(
-                    "RGBA", (pix.width(), pix.height()), img_bytes
+                ptr = qimg.constBits()
+                ptr.setsize(qimg.sizeInBytes())
+                img = Image.frombuffer(
+                    "RGBA",
+                    (qimg.width(), qimg.height()),
+                    bytes(ptr),
+                    "raw",
+                    "RGBA",
+                    qimg.bytesPerLine(),
+                    1,
                 )
             else:
-                img = Image.open(str(p)).convert("RGBA")
-
-            if expected_size:
-                img = img.resize(expected_size, Image.Resampling.LANCZOS)
-
-            return img, img.width, img.height
+                img = Image.open(str(p))
+                if expected_size:
+                    # Let JPEGs decode at a reduced scale when shrinking
+                    img.draft("RGB", expected_size)
+                img = img.convert("RGBA")
+
+            if expected_size and img.size != expected_size:
+                # reducing_gap shrinks large frames with a cheap box filter
+                # before the final LANCZOS pass
+                img = img.resize(
+                    expected_size,
+                    Image.Resampling.LANCZOS,
+                    reducing_gap=RESIZE_REDUCING_GAP,
+                )
         except Exception:
             return None, 0, 0
 
+        return img, img.width, img.height
+
     # ---------- Unsaved / title ----------
     def mark_unsaved(self) -> None:
+        self._edited_during_save = True
+        # Title/status only change on the first edit after a save or load
+        if self.unsaved_changes:
+            return
         self.unsaved_changes = True
         self.update_title_and_status()
 
@@ -746,6 +1059,8 @@ class MainWindow(QMainWindow):
             self.file_label.setText(text)
 
     def maybe_save_before_discard(self) -> bool:
+        # A running save may be about to clear unsaved_changes
+        self.wait_for_save()
         if not self.unsaved_changes:
             return True
         resp = QMessageBox.question(
@@ -758,6 +1073,7 @@ class MainWindow(QMainWindow):
         )
         if resp == QMessageBox.StandardButton.Yes:
             self.save_gif()
+            self.wait_for_save()
             return not self.unsaved_changes
         elif resp == QMessageBox.StandardButton.No:
             return True
@@ -775,38 +1091,77 @@ class MainWindow(QMainWindow):
             return
 
         f = self.frames[self.current_index]
-        p = Path(f.source_path) if f.source_path else None
-        if not p or not p.exists():
+        frame_key = self.frame_cache_key(f)
+        if frame_key is None:
             self.preview_label.setText("Missing frame file.")
             self.preview_label.setPixmap(QPixmap())
             return
-
-        if p.suffix.lower() == ".svg":
-            widget = QSvgWidget(str(p))
-            size = self.preview_label.size()
-            widget.resize(size.width(), size.height())
-            pix = QPixmap(widget.size())
-            pix.fill(Qt.GlobalColor.transparent)
-            widget.render(pix)
+        source, mtime = frame_key
+        size = self.preview_label.size()
+        key = (source, mtime, size.width(), size.height())
+        pix = self._preview_cache.get(key)
+        if pix is not None:
+            self._preview_cache.move_to_end(key)
         else:
-            pix = QPixmap(str(p))
+            if f.is_svg:
+                pix = QPixmap.fromImage(
+                    self.render_svg(f.path, mtime, size.width(), size.height())
+                )
+            else:
+                pix = self._get_full_pixmap(f, frame_key)
+
+            if not pix.isNull():
+                pix = pix.scaled(
+                    size.width(),
+                    size.height(),
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation,
+                )
+                self._preview_cache[key] = pix
+                if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+                    self._preview_cache.popitem(last=False)
 
         if not pix.isNull():
-            size = self.preview_label.size()
-            pix = pix.scaled(
-                size.width(),
-                size.height(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
             self.preview_label.setPixmap(pix)
             self.preview_label.setText("")
         else:
             self.preview_label.setText("Unable to display frame.")
 
+    def _get_full_pixmap(
+        self, frame: FrameData, key: FrameKey
+    ) -> QPixmap:
+        """Return the full-resolution pixmap for a frame, decoding it only once."""
+        pix = self._full_pix_cache.get(key)
+        if pix is not None:
+            self._full_pix_cache.move_to_end(key)
+            return pix
+        if frame.pil_image is not None:
+            pix = QPixmap.fromImage(ImageQt.ImageQt(self.frame_rgba(frame)))
+        else:
+            pix = QPixmap(frame.source_path)
+        if not pix.isNull():
+            self._full_pix_cache[key] = pix
+            self._full_pix_bytes += self._pixmap_bytes(pix)
+            # Evict least recently used decodes, but always keep the newest one
+            while (
+                self._full_pix_bytes > FULL_PIX_CACHE_BYTES
+                and len(self._full_pix_cache) > 1
+            ):
+                self._drop_full_pixmap(next(iter(self._full_pix_cache)))
+        return pix
+
+    def _drop_full_pixmap(self, key: FrameKey) -> None:
+        pix = self._full_pix_cache.pop(key, None)
+        if pix is not None:
+            self._full_pix_bytes -= self._pixmap_bytes(pix)
+
+    @staticmethod
+    def _pixmap_bytes(pix: QPixmap) -> int:
+        return pix.width() * pix.height() * max(1, pix.depth() // 8)
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self.update_preview()
+        self._resize_timer.start()
 
     def toggle_play_pause(self) -> None:
         if self.is_playing:
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import itertools
 import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
+from PIL import Image
+
+# Source of FrameData.frame_id values; ids are never reused within a session
+_frame_ids = itertools.count(1)
+
 
 @dataclass
 class FrameData:
@@ -14,6 +21,23 @@ class FrameData:
     duration_ms: int
     is_custom_duration: bool
     is_checked: bool = False
+    # Decoded pixels for frames that have no file on disk (e.g. GIF frames)
+    pil_image: Optional[Image.Image] = field(default=None, repr=False, compare=False)
+    # Stable token identifying this frame's pixels in caches
+    frame_id: int = field(default_factory=lambda: next(_frame_ids), compare=False)
+    is_svg: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.is_svg = self.pil_image is None and self.suffix_lower == ".svg"
+
+    @cached_property
+    def path(self) -> Optional[Path]:
+        """source_path as a Path, or None for frames without a file."""
+        return Path(self.source_path) if self.source_path else None
+
+    @cached_property
+    def suffix_lower(self) -> str:
+        return self.path.suffix.lower() if self.path else ""
 
 
 @dataclass
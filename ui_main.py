@@ -5,6 +5,7 @@ from PyQt6.QtWidgets import (
     QComboBox,
     QHBoxLayout,
     QLabel,
+    QProgressBar,
     QPushButton,
     QSpinBox,
     QSplitter,
@@ -132,6 +133,13 @@ def build_main_ui(win) -> None:
     win.file_label = QLabel("No file loaded.", status)
     status.addPermanentWidget(win.file_label)
 
+    # Shown while a GIF is being encoded in the background
+    win.save_progress = QProgressBar(status)
+    win.save_progress.setMaximumWidth(160)
+    win.save_progress.setTextVisible(False)
+    win.save_progress.hide()
+    status.addPermanentWidget(win.save_progress)
+
     # Basic header behavior; fine-tuned later by apply_config_to_ui
     header = win.tree.header()
     header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator, List
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+from PIL import Image
+
+
+class GifSaveSignals(QObject):
+    """Signals emitted by GifSaveWorker (QRunnable can't define its own)."""
+    progress = pyqtSignal(int)  # number of frames handed to the encoder
+    finished = pyqtSignal(str)  # path that was written
+    failed = pyqtSignal(str)  # error message
+
+
+class GifSaveWorker(QRunnable):
+    """Encode already-decoded frames into an animated GIF off the UI thread."""
+
+    def __init__(self, path: Path, images: List[Image.Image], durations: List[int]):
+        super().__init__()
+        self.path = path
+        self.images = images
+        self.durations = durations
+        self.signals = GifSaveSignals()
+
+    def run(self) -> None:
+        try:
+            self.images[0].save(
+                str(self.path),
+                save_all=True,
+                append_images=self._iter_appended(),
+                duration=self.durations,
+                loop=0,
+                disposal=2,
+            )
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(str(self.path))
+
+    def _iter_appended(self) -> Iterator[Image.Image]:
+        # Pillow pulls appended frames one at a time, so this doubles as a
+        # per-frame progress callback
+        self.signals.progress.emit(1)
+        for i, img in enumerate(self.images[1:], start=2):
+            yield img
+            self.signals.progress.emit(i)